@@ -11,11 +11,12 @@ from gnu2_demangler.cxx import (
     CxxType,
     CxxValue,
 )
-from gnu2_demangler.demangler import GNU2Demangler, demangle, parse
+from gnu2_demangler.demangler import GNU2Demangler, demangle, demangle_many, parse
 
 __all__ = [
     "parse",
     "demangle",
+    "demangle_many",
     "GNU2Demangler",
     "CxxName",
     "CxxSymbol",
@@ -3,18 +3,39 @@ CLI for the demangler.
 """
 
 import argparse
+import functools
 
 from gnu2_demangler.demangler import demangle, parse
 
-parser = argparse.ArgumentParser("gnu2-demangler", description="Demangler for GNU v2 C++ symbols.")
-parser.add_argument("symbol", help="Symbol to demangle.", type=str)
-parser.add_argument(
-    "--error-on-failure", "-e", help="Throw an exception if demangling fails", action="store_true"
-)
+
+@functools.lru_cache(maxsize=None)
+def _make_parser() -> argparse.ArgumentParser:
+    """
+    Build the CLI's argument parser. This is deferred until first use, so importing
+    this module stays cheap.
+    """
+    parser = argparse.ArgumentParser(
+        "gnu2-demangler", description="Demangler for GNU v2 C++ symbols."
+    )
+    parser.add_argument("symbol", help="Symbol to demangle.", type=str)
+    parser.add_argument(
+        "--error-on-failure",
+        "-e",
+        help="Throw an exception if demangling fails",
+        action="store_true",
+    )
+    return parser
+
+
+def __getattr__(name: str):
+    # `parser` used to be built at import time; keep it available as a module attribute.
+    if name == "parser":
+        return _make_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
-    args = parser.parse_args()  # noqa
+    args = _make_parser().parse_args()  # noqa
     if args.error_on_failure:
         print(str(parse(args.symbol)))
     else:
@@ -2,15 +2,19 @@
 Module implementing C++ type abstractions.
 """
 
-import copy
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import List, Optional, Union
+from typing import ClassVar, List, Optional, Union
 
 from gnu2_demangler.strenum import StrEnum
 
+# `slots` was added to `dataclass` in Python 3.10. Slotted nodes are smaller and have
+# faster attribute access, which adds up since the demangler creates many of them.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class CxxValue:
     """
     Represents a literal value inside of a C++ template or array.
@@ -25,6 +29,18 @@ class CxxValue:
 
     value: Union[int, float, bool, str, "CxxTerm"]
 
+    # Printed before this object when it's used as a template parameter.
+    _template_prefix: ClassVar[str] = ""
+
+    def clone(self) -> "CxxValue":
+        """
+        Return a copy of this value which can be modified independently of the original.
+        """
+        value = self.value
+        if isinstance(value, CxxTerm):
+            value = value.clone()
+        return CxxValue(value=value)
+
     def __str__(self) -> str:
         """
         Print this value as a C literal. The resulting string will depend on the
@@ -39,7 +55,7 @@ class CxxValue:
         return str(self.value)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CxxTemplate:
     """
     Represents the contents of a C++ template. Templates can have one of three
@@ -51,17 +67,30 @@ class CxxTemplate:
 
     params: list[Union["CxxType", CxxValue, "CxxName"]]
 
+    # Printed before this object when it's used as a template parameter.
+    _template_prefix: ClassVar[str] = "template"
+
+    def clone(self) -> "CxxTemplate":
+        """
+        Return a copy of these template parameters which can be modified independently
+        of the original.
+        """
+        return CxxTemplate(params=[p.clone() for p in self.params])
+
     def __str__(self):
         """
         Return these template parameters as a string.
         """
-        param_strs = [
-            f"template{str(p)}" if isinstance(p, CxxTemplate) else str(p) for p in self.params
-        ]
-        return f"<{', '.join(param_strs)}>"
+        params = self.params
+        if len(params) == 1:
+            # Most templates have a single parameter, which needs no joining.
+            return "<" + params[0]._template_prefix + str(params[0]) + ">"
 
+        param_strs = [p._template_prefix + str(p) for p in params]
+        return "<" + ", ".join(param_strs) + ">"
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class CxxName:
     """
     Represents the name of some explicit C++ object or function.
@@ -70,6 +99,23 @@ class CxxName:
     name: str
     template: Optional[CxxTemplate] = None
 
+    # Printed before this object when it's used as a template parameter.
+    _template_prefix: ClassVar[str] = ""
+
+    def __post_init__(self):
+        """
+        Intern the identifier, since the same class and namespace names recur across
+        (and within) symbols.
+        """
+        self.name = sys.intern(self.name)
+
+    def clone(self) -> "CxxName":
+        """
+        Return a copy of this name which can be modified independently of the original.
+        """
+        template = self.template.clone() if self.template is not None else None
+        return CxxName(name=self.name, template=template)
+
     def add_template_param(self, param: Union["CxxType", CxxValue, "CxxName"]):
         """
         Convenience method to add a parameter to this name's template params.
@@ -82,11 +128,10 @@ class CxxName:
         self.template.params.append(param)
 
     def __str__(self):
-        template_str = str(self.template) if self.template else ""
-        return f"{self.name}{template_str}"
+        return self.name + str(self.template) if self.template else self.name
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CxxTerm:
     """
     Represents one part of a C++ name or type.
@@ -133,90 +178,79 @@ class CxxTerm:
         SYMBOL_REF = "symbol_ref"
 
         def is_const(self) -> bool:
-            return self == CxxTerm.Kind.CONST
+            return self is CxxTerm.Kind.CONST
 
         def is_volatile(self) -> bool:
-            return self == CxxTerm.Kind.VOLATILE
+            return self is CxxTerm.Kind.VOLATILE
 
         def is_restrict(self) -> bool:
-            return self == CxxTerm.Kind.RESTRICT
+            return self is CxxTerm.Kind.RESTRICT
 
         def is_cv_qualifier(self) -> bool:
-            return self in [CxxTerm.Kind.CONST, CxxTerm.Kind.VOLATILE, CxxTerm.Kind.RESTRICT]
+            return bool(self._mask & _CV_QUALIFIERS_MASK)
 
         def is_sign(self) -> bool:
-            return self in [CxxTerm.Kind.SIGNED, CxxTerm.Kind.UNSIGNED]
+            return bool(self._mask & _SIGNS_MASK)
 
         def is_complex(self) -> bool:
-            return self == CxxTerm.Kind.COMPLEX
+            return self is CxxTerm.Kind.COMPLEX
 
         def is_void(self) -> bool:
-            return self == CxxTerm.Kind.VOID
+            return self is CxxTerm.Kind.VOID
 
         def is_arithmetic_type_specifier(self) -> bool:
-            return self in [CxxTerm.Kind.SIGNED, CxxTerm.Kind.UNSIGNED, CxxTerm.Kind.COMPLEX]
+            return bool(self._mask & _ARITHMETIC_TYPE_SPECIFIERS_MASK)
 
         def is_bool(self) -> bool:
-            return self == CxxTerm.Kind.BOOL
+            return self is CxxTerm.Kind.BOOL
 
         def is_character(self) -> bool:
-            return self in [CxxTerm.Kind.CHAR, CxxTerm.Kind.WIDE_CHAR]
+            return bool(self._mask & _CHARACTERS_MASK)
 
         def is_integer(self) -> bool:
-            return self in [
-                CxxTerm.Kind.CHAR,
-                CxxTerm.Kind.SHORT,
-                CxxTerm.Kind.INT,
-                CxxTerm.Kind.LONG,
-                CxxTerm.Kind.LONG_LONG,
-            ]
+            return bool(self._mask & _INTEGERS_MASK)
 
         def is_real(self) -> bool:
-            return self in [CxxTerm.Kind.FLOAT, CxxTerm.Kind.DOUBLE, CxxTerm.Kind.LONG_DOUBLE]
+            return bool(self._mask & _REALS_MASK)
 
         def is_integral(self) -> bool:
-            return self.is_integer() or self.is_character() or self.is_bool()
+            return bool(self._mask & _INTEGRALS_MASK)
 
         def is_arithmetic_type(self) -> bool:
-            return self.is_integral() or self.is_real()
+            return bool(self._mask & _ARITHMETIC_TYPES_MASK)
 
         def can_have_sign(self) -> bool:
-            return self.is_integer()
+            return bool(self._mask & _INTEGERS_MASK)
 
         def can_have_complex(self) -> bool:
-            return self.is_real()
+            return bool(self._mask & _REALS_MASK)
 
         def is_pointer(self) -> bool:
-            return self == CxxTerm.Kind.POINTER
+            return self is CxxTerm.Kind.POINTER
 
         def is_reference(self) -> bool:
-            return self in [CxxTerm.Kind.LVALUE_REFERENCE, CxxTerm.Kind.RVALUE_REFERENCE]
+            return bool(self._mask & _REFERENCES_MASK)
 
         def is_ptr_or_ref(self) -> bool:
-            return self.is_pointer() or self.is_reference()
+            return bool(self._mask & _PTRS_OR_REFS_MASK)
 
         def is_array(self) -> bool:
-            return self == CxxTerm.Kind.ARRAY
+            return self is CxxTerm.Kind.ARRAY
 
         def is_memory_type(self) -> bool:
-            return self.is_pointer() or self.is_reference() or self.is_array()
+            return bool(self._mask & _MEMORY_TYPES_MASK)
 
         def is_function(self) -> bool:
-            return self == CxxTerm.Kind.FUNCTION
+            return self is CxxTerm.Kind.FUNCTION
 
         def is_qualified_name(self) -> bool:
-            return self == CxxTerm.Kind.QUALIFIED
+            return self is CxxTerm.Kind.QUALIFIED
 
         def is_symbol_ref(self) -> bool:
-            return self == CxxTerm.Kind.SYMBOL_REF
+            return self is CxxTerm.Kind.SYMBOL_REF
 
         def is_fund_type(self) -> bool:
-            return (
-                self.is_void()
-                or self.is_arithmetic_type()
-                or self.is_function()
-                or self.is_qualified_name()
-            )
+            return bool(self._mask & _FUND_TYPES_MASK)
 
     kind: Kind
 
@@ -230,31 +264,34 @@ class CxxTerm:
 
     def __post_init__(self):
         """
-        Validate the term's contents.
+        Validate the term's contents. These checks only catch programmer errors, so
+        they are skipped entirely under `python -O`. Use `validate()` to check a term
+        explicitly.
         """
-        if self.array_dim:
-            assert (
-                self.kind.is_array()
-            ), f"Non-array term {self.kind.name} cannot have array dimension."
+        if __debug__:
+            self.validate()
 
-        if self.function_params or self.function_return:
-            assert (
-                self.kind.is_function()
-            ), f"Non-function term {self.kind.name} cannot have function params/return type."
+    def validate(self):
+        """
+        Verify that this term only carries the data its kind allows. Raises an
+        `AssertionError` if not.
+        """
+        kind = self.kind
+        if self.array_dim and kind is not CxxTerm.Kind.ARRAY:
+            raise AssertionError(f"Non-array term {kind.name} cannot have array dimension.")
 
-        if self.qualified_name:
-            assert (
-                self.kind.is_qualified_name()
-            ), f"Non-qualified-name term {self.kind.name} cannot have qualified name."
+        if (self.function_params or self.function_return) and kind is not CxxTerm.Kind.FUNCTION:
+            raise AssertionError(
+                f"Non-function term {kind.name} cannot have function params/return type."
+            )
 
-        if self.symbol_ref:
-            assert (
-                self.kind.is_symbol_ref()
-            ), f"Non-symbol-ref term {self.kind.name} cannot have symbol ref."
-        else:
-            assert (
-                not self.kind.is_symbol_ref()
-            ), "Symbol ref term must have `symbol_ref` populated!"
+        if self.qualified_name and kind is not CxxTerm.Kind.QUALIFIED:
+            raise AssertionError(f"Non-qualified-name term {kind.name} cannot have qualified name.")
+
+        if bool(self.symbol_ref) != (kind is CxxTerm.Kind.SYMBOL_REF):
+            if self.symbol_ref:
+                raise AssertionError(f"Non-symbol-ref term {kind.name} cannot have symbol ref.")
+            raise AssertionError("Symbol ref term must have `symbol_ref` populated!")
 
     def add_base_name(self, name: CxxName):
         """
@@ -298,9 +335,10 @@ class CxxTerm:
             other.kind.is_qualified_name()
         ), f"Cannot qualify name with term of type {other.kind.name}!"
 
-        # Iterate over a shallow copy in reversed order.
-        for name in other.qualified_name[::-1]:
-            self.add_qualifying_name(name)
+        if self.qualified_name is None:
+            self.qualified_name = []
+        # Prepend all of the other term's names with a single slice assignment.
+        self.qualified_name[:0] = other.qualified_name
 
     def base_on(self, other: "CxxTerm"):
         """
@@ -338,33 +376,66 @@ class CxxTerm:
         """
         Print this term as a C token or declarator if possible.
         """
+        kind = self.kind
+        if not kind._mask & _PAYLOAD_KINDS_MASK:
+            # Most terms print as just their kind, so check for that first.
+            return kind._str
 
-        if self.kind.is_array():
+        if kind is CxxTerm.Kind.ARRAY:
             # Format array dimension.
-            assert self.array_dim is not None
-            return f"[{self.array_dim}]"
+            dim = self.array_dim
+            assert dim is not None
+            return _ARRAY_DIM_STR[dim] if 0 <= dim < len(_ARRAY_DIM_STR) else f"[{dim}]"
 
-        elif self.kind.is_function():
+        elif kind is CxxTerm.Kind.FUNCTION:
             # Format as a function declarator for the convenience of `CxxType.__str__()`.
             # This means we only print the parameters.
             param_str = (
-                ", ".join([str(p) for p in self.function_params])
-                if self.function_params
-                else "void"
+                ", ".join(map(str, self.function_params)) if self.function_params else "void"
             )
-            return f"({param_str})"
+            return "(" + param_str + ")"
 
-        elif self.kind.is_qualified_name():
+        elif kind is CxxTerm.Kind.QUALIFIED:
             # Format qualified name.
             assert self.qualified_name
-            return "::".join([str(n) for n in self.qualified_name])
+            return "::".join(map(str, self.qualified_name))
 
-        elif self.kind.is_symbol_ref():
+        else:
             assert self.symbol_ref
             return f"&{self.symbol_ref.name}"
 
-        else:
-            return str(self.kind)
+    def clone(self) -> "CxxTerm":
+        """
+        Return a copy of this term which can be modified independently of the original.
+
+        Terms without a payload are never modified (see `atomic()`), so they are returned
+        as-is.
+        """
+        kind = self.kind
+        if not kind._mask & _PAYLOAD_KINDS_MASK:
+            return self
+
+        function_params = self.function_params
+        if function_params is not None:
+            function_params = [t.clone() for t in function_params]
+        function_return = self.function_return
+        if function_return is not None:
+            function_return = function_return.clone()
+        qualified_name = self.qualified_name
+        if qualified_name is not None:
+            qualified_name = [n.clone() for n in qualified_name]
+        symbol_ref = self.symbol_ref
+        if symbol_ref is not None:
+            symbol_ref = symbol_ref.clone()
+
+        return CxxTerm(
+            kind=kind,
+            array_dim=self.array_dim,
+            function_params=function_params,
+            function_return=function_return,
+            qualified_name=qualified_name,
+            symbol_ref=symbol_ref,
+        )
 
     @staticmethod
     def make_name(qualified_name: list[CxxName]) -> "CxxTerm":
@@ -373,8 +444,85 @@ class CxxTerm:
         """
         return CxxTerm(kind=CxxTerm.Kind.QUALIFIED, qualified_name=qualified_name)
 
+    @staticmethod
+    def atomic(kind: "CxxTerm.Kind") -> "CxxTerm":
+        """
+        Convenience method for getting a CxxTerm which carries no data other than its kind,
+        such as a CV qualifier, type specifier, primitive type, pointer, or reference.
+
+        Terms for these kinds are shared, so the returned term must not be mutated.
+        Kinds which carry extra data get a freshly constructed term.
+        """
+        term = _ATOMIC_TERMS.get(kind)
+        return term if term is not None else CxxTerm(kind=kind)
+
+
+# Give each `CxxTerm.Kind` a unique bit, so that the `Kind.is_*()` predicates reduce to a
+# single bitwise test against one of the category masks below.
+for _bit, _kind in enumerate(CxxTerm.Kind):
+    _kind._mask = 1 << _bit
+del _bit, _kind
 
-@dataclass(frozen=True)
+
+def _kind_mask(*kinds: CxxTerm.Kind) -> int:
+    """
+    Combine the bits of the given kinds into a single category mask.
+    """
+    mask = 0
+    for kind in kinds:
+        mask |= kind._mask
+    return mask
+
+
+_CV_QUALIFIERS_MASK = _kind_mask(CxxTerm.Kind.CONST, CxxTerm.Kind.VOLATILE, CxxTerm.Kind.RESTRICT)
+_SIGNS_MASK = _kind_mask(CxxTerm.Kind.SIGNED, CxxTerm.Kind.UNSIGNED)
+_ARITHMETIC_TYPE_SPECIFIERS_MASK = _SIGNS_MASK | _kind_mask(CxxTerm.Kind.COMPLEX)
+_CHARACTERS_MASK = _kind_mask(CxxTerm.Kind.CHAR, CxxTerm.Kind.WIDE_CHAR)
+_INTEGERS_MASK = _kind_mask(
+    CxxTerm.Kind.CHAR,
+    CxxTerm.Kind.SHORT,
+    CxxTerm.Kind.INT,
+    CxxTerm.Kind.LONG,
+    CxxTerm.Kind.LONG_LONG,
+)
+_REALS_MASK = _kind_mask(CxxTerm.Kind.FLOAT, CxxTerm.Kind.DOUBLE, CxxTerm.Kind.LONG_DOUBLE)
+_INTEGRALS_MASK = _INTEGERS_MASK | _CHARACTERS_MASK | _kind_mask(CxxTerm.Kind.BOOL)
+_ARITHMETIC_TYPES_MASK = _INTEGRALS_MASK | _REALS_MASK
+_REFERENCES_MASK = _kind_mask(CxxTerm.Kind.LVALUE_REFERENCE, CxxTerm.Kind.RVALUE_REFERENCE)
+_PTRS_OR_REFS_MASK = _REFERENCES_MASK | _kind_mask(CxxTerm.Kind.POINTER)
+_MEMORY_TYPES_MASK = _PTRS_OR_REFS_MASK | _kind_mask(CxxTerm.Kind.ARRAY)
+_FUND_TYPES_MASK = _ARITHMETIC_TYPES_MASK | _kind_mask(
+    CxxTerm.Kind.VOID,
+    CxxTerm.Kind.FUNCTION,
+    CxxTerm.Kind.QUALIFIED,
+)
+# Kinds of terms which carry data besides the kind itself.
+_PAYLOAD_KINDS_MASK = _kind_mask(
+    CxxTerm.Kind.ARRAY, CxxTerm.Kind.FUNCTION, CxxTerm.Kind.QUALIFIED, CxxTerm.Kind.SYMBOL_REF
+)
+# Types printed as a single term, without any declarator syntax.
+_SIMPLE_TYPES_MASK = _ARITHMETIC_TYPES_MASK | _kind_mask(CxxTerm.Kind.VOID, CxxTerm.Kind.QUALIFIED)
+# Terms printed before the type they modify.
+_PREFIX_TERMS_MASK = _CV_QUALIFIERS_MASK | _ARITHMETIC_TYPE_SPECIFIERS_MASK
+
+
+# Store each kind's printed form on the member itself as a plain `str`, so that printing
+# a term is a single attribute lookup.
+for _kind in CxxTerm.Kind:
+    _kind._str = _kind.value
+del _kind
+
+
+# Preformatted array declarators for the most common (small) array dimensions.
+_ARRAY_DIM_STR = tuple(f"[{i}]" for i in range(256))
+
+# Shared terms for every kind without a payload. See `CxxTerm.atomic()`.
+_ATOMIC_TERMS: dict[CxxTerm.Kind, CxxTerm] = {
+    kind: CxxTerm(kind=kind) for kind in CxxTerm.Kind if not kind._mask & _PAYLOAD_KINDS_MASK
+}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CxxDeclComponent:
     """
     Convenience dataclass for grouping terms into C++ "declarator" components.
@@ -400,19 +548,19 @@ class CxxDeclComponent:
         FUNCTION = 7
 
         def is_pointer(self) -> bool:
-            return self in [CxxDeclComponent.Kind.POINTER, CxxDeclComponent.Kind.POINTER_TO_MEMBER]
+            return self in _DECL_POINTERS
 
         def is_ref(self) -> bool:
-            return self in [CxxDeclComponent.Kind.LVALUE_REF, CxxDeclComponent.Kind.RVALUE_REF]
+            return self in _DECL_REFS
 
         def is_specifier_seq(self) -> bool:
             return self == CxxDeclComponent.Kind.SPECIFIER_SEQ
 
         def is_ptr_or_ref(self) -> bool:
-            return self.is_pointer() or self.is_ref()
+            return self in _DECL_PTRS_OR_REFS
 
         def is_noptr_declarator(self) -> bool:
-            return self in [CxxDeclComponent.Kind.ARRAY, CxxDeclComponent.Kind.FUNCTION]
+            return self in _DECL_NOPTR_DECLARATORS
 
     kind: Kind
     terms: list[CxxTerm]
@@ -481,7 +629,8 @@ class CxxDeclComponent:
 
         i: int = 0
         kind: CxxDeclComponent.Kind = None
-        terms_queue: list[CxxTerm] = copy.copy(typ.terms)
+        # Only read from here, so there's no need to copy the type's terms.
+        terms_queue: list[CxxTerm] = typ.terms
         decl_queue: list[CxxTerm] = []
 
         # Iterate through the list of terms, partitioning into decl components.
@@ -517,9 +666,9 @@ class CxxDeclComponent:
                         i += 1
 
             if kind is not None:
-                # Create the decl from the queue of decl terms, then clear the queue.
-                decl.append(CxxDeclComponent(kind=kind, terms=copy.copy(decl_queue)))
-                decl_queue.clear()
+                # Create the decl from the queue of decl terms, then start a new queue.
+                decl.append(CxxDeclComponent(kind=kind, terms=decl_queue))
+                decl_queue = []
 
                 # If we just created a function component, process its return type
                 # immediately and append its components.
@@ -540,18 +689,27 @@ class CxxDeclComponent:
         """
         Print this decl as a string without any context.
         """
-        terms_to_print = self.terms
+        if len(self.terms) == 1:
+            return str(self.terms[0])
 
+        terms_to_print = self.terms
         if self.kind.is_pointer():
             # Print terms in reverse order so CV qualifiers appear on the right side
             # instead of the left, as defined by the C++ grammar.
             # Example: "[CONST, POINTER]" prints as `* const`.
-            terms_to_print.reverse()
+            terms_to_print = reversed(terms_to_print)
+
+        return " ".join(map(str, terms_to_print))
 
-        return " ".join(str(t) for t in terms_to_print)
 
+# Categories of `CxxDeclComponent.Kind`, built once at import time.
+_DECL_POINTERS = frozenset({CxxDeclComponent.Kind.POINTER, CxxDeclComponent.Kind.POINTER_TO_MEMBER})
+_DECL_REFS = frozenset({CxxDeclComponent.Kind.LVALUE_REF, CxxDeclComponent.Kind.RVALUE_REF})
+_DECL_PTRS_OR_REFS = _DECL_POINTERS | _DECL_REFS
+_DECL_NOPTR_DECLARATORS = frozenset({CxxDeclComponent.Kind.ARRAY, CxxDeclComponent.Kind.FUNCTION})
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class CxxType:
     """
     Represents a complete C++ type.
@@ -573,24 +731,39 @@ class CxxType:
 
     terms: List[CxxTerm] = field(default_factory=list)
 
+    # Printed before this object when it's used as a template parameter.
+    _template_prefix: ClassVar[str] = ""
+
+    def clone(self) -> "CxxType":
+        """
+        Return a copy of this type which can be modified independently of the original.
+        """
+        return CxxType(terms=[t.clone() for t in self.terms])
+
     def _primitive_type_index(self) -> int:
         """
         Return the index of the primitive type in the `terms` array. Throws an error
         if no fundamental type is found.
         """
-        for i in reversed(range(len(self.terms))):
-            if self.terms[i].kind.is_fund_type():
-                return i
+        idx = self._has_primitive_type_index()
+        if idx is None:
+            raise AssertionError("No primitive type found in CxxType!")
 
-        raise AssertionError("No primitive type found in CxxType!")
+        return idx
 
     def _has_primitive_type_index(self) -> Optional[int]:
         """
         Return the index of the primitive type in the `terms` array, if known.
         Otherwise, returns `None`.
         """
-        for i in reversed(range(len(self.terms))):
-            if self.terms[i].kind.is_fund_type():
+        terms = self.terms
+        num_terms = len(terms)
+        if num_terms and terms[-1].kind._mask & _FUND_TYPES_MASK:
+            # Most types end in their primitive type, so check that first.
+            return num_terms - 1
+
+        for i in range(num_terms - 2, -1, -1):
+            if terms[i].kind._mask & _FUND_TYPES_MASK:
                 return i
 
         return None
@@ -618,25 +791,133 @@ class CxxType:
         """
         Format this C++ type as a declaration with an optional identifier.
         """
-        declarators: list[CxxDeclComponent] = CxxDeclComponent.from_type(self, identifier)
+        # Fast path for the most common symbol type: a function without a return type
+        # (i.e. not a template function), optionally followed by CV qualifiers.
+        terms = self.terms
+        if terms and terms[0].kind.is_function() and terms[0].function_return is None:
+            if all(t.kind._mask & _CV_QUALIFIERS_MASK for t in terms[1:]):
+                result = str(identifier) + str(terms[0]) if identifier else str(terms[0])
+                if len(terms) > 1:
+                    result += " " + " ".join(map(str, terms[1:]))
+                return result
+
+        # `left` collects the pieces printed to the left of the declaration so far
+        # (innermost first), and `right` the pieces printed to its right.
+        left: list[str] = []
+        right: list[str] = []
+        prev_is_ptr_or_ref: Optional[bool] = None
+        if identifier:
+            assert (
+                identifier.kind.is_qualified_name()
+            ), "Identifier for decl must be qualified name."
+            right.append(str(identifier))
+            prev_is_ptr_or_ref = False
+
+        self._format_declarators(left, right, prev_is_ptr_or_ref)
+
+        left.reverse()
+        return "".join(left) + "".join(right)
+
+    def _format_declarators(
+        self, left: list[str], right: list[str], prev_is_ptr_or_ref: Optional[bool]
+    ) -> Optional[bool]:
+        """
+        Partition this type's terms into declarators and apply each one to the
+        declaration being built in `left` and `right`.
+
+        This is equivalent to applying the components from `CxxDeclComponent.from_type()`
+        in order, without creating them. `prev_is_ptr_or_ref` describes the last
+        declarator applied (`None` if there was none), and the same is returned for the
+        last declarator applied by this call.
+        """
+        terms = self.terms
+        num_terms = len(terms)
+        start = 0
+        i = 0
+        while i < num_terms:
+            term = terms[i]
+            mask = term.kind._mask
+
+            if mask & _PTRS_OR_REFS_MASK:
+                # Print on the left side. CV qualifiers of pointers are printed after
+                # the `*`, as defined by the C++ grammar.
+                decl_terms = terms[start : i + 1]
+                if term.kind is CxxTerm.Kind.POINTER:
+                    decl_terms.reverse()
+                left.append(" ".join(map(str, decl_terms)))
+                prev_is_ptr_or_ref = True
+
+            elif mask & _SIMPLE_TYPES_MASK:
+                # Print the base type on the left side, separated from any previous
+                # declarators.
+                if prev_is_ptr_or_ref is not None:
+                    left.append(" ")
+                left.append(" ".join(map(str, terms[start : i + 1])))
+                prev_is_ptr_or_ref = False
+
+            elif term.kind is CxxTerm.Kind.ARRAY or term.kind is CxxTerm.Kind.FUNCTION:
+                end = i + 1
+                if term.kind is CxxTerm.Kind.FUNCTION:
+                    # Function declarators include any CV qualifiers after them.
+                    # Like `from_type()`, skip the term after those qualifiers.
+                    while end < num_terms and terms[end].kind._mask & _CV_QUALIFIERS_MASK:
+                        end += 1
+                    if end > i + 1:
+                        i = end
+
+                # Print on the right side, surrounding any previous pointer/ref
+                # declarator in parentheses.
+                if prev_is_ptr_or_ref:
+                    left.append("(")
+                    right.append(")")
+                right.append(" ".join(map(str, terms[start:end])))
+                prev_is_ptr_or_ref = False
+
+                if term.kind is CxxTerm.Kind.FUNCTION and term.function_return is not None:
+                    prev_is_ptr_or_ref = term.function_return._format_declarators(
+                        left, right, prev_is_ptr_or_ref
+                    )
+
+            else:
+                # Not a declarator of its own; it's printed with the next one.
+                i += 1
+                continue
 
-        # Recursively apply declarators to obtain our string.
-        result = ""
-        prev_decl = None
-        for decl in declarators:
-            result = decl.apply(cur_decl_content=result, prev_decl=prev_decl)
-            prev_decl = decl
+            i += 1
+            start = i
 
-        return result
+        assert (
+            start >= num_terms
+        ), "Decl. queue not empty after loop ended! Is there a misplaced CV qualifier?"
+
+        return prev_is_ptr_or_ref
 
     def __str__(self) -> str:
         """
         Format this C++ type as a declaration.
         """
+        # Fast path for the most common shape, which needs no declarator handling:
+        # pointers/references to a simple type with optional prefixes, such as
+        # `int`, `const char *`, or `unsigned long &`.
+        terms = self.terms
+        last = len(terms) - 1
+        if last >= 0 and terms[last].kind._mask & _SIMPLE_TYPES_MASK:
+            num_ptrs = 0
+            while num_ptrs < last and terms[num_ptrs].kind._mask & _PTRS_OR_REFS_MASK:
+                num_ptrs += 1
+            i = num_ptrs
+            while i < last and terms[i].kind._mask & _PREFIX_TERMS_MASK:
+                i += 1
+            if i == last:
+                result = " ".join(map(str, terms[num_ptrs:]))
+                if num_ptrs:
+                    result += " " + "".join(map(str, reversed(terms[:num_ptrs])))
+                return result
+
         return self.format(identifier=None)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CxxSymbol:
     """
     Represents a C++ symbol and its type (if known).
@@ -656,22 +937,23 @@ class CxxSymbol:
 
     def __post_init__(self):
         """
-        Verify certain properties of the new symbol.
+        Verify certain properties of the new symbol. Like `CxxTerm.__post_init__()`, these
+        checks are compiled out under `python -O`.
         """
+        if not __debug__:
+            return
+
         # Verify known mutually exclusive flags.
-        xor_flags = [
-            self.is_type_info_node,
-            self.is_type_info_func,
-            self.is_vtable,
-            self.is_global_constructor,
-            self.is_global_destructor,
-            self.is_virtual_thunk,
-            self.is_dll_imported,
-        ]
-        if any(xor_flags):
-            assert (
-                len([b for b in xor_flags if b]) <= 1
-            ), "Multiple mutually exclusive flags are set!"
+        num_xor_flags = (
+            self.is_type_info_node
+            + self.is_type_info_func
+            + self.is_vtable
+            + self.is_global_constructor
+            + self.is_global_destructor
+            + self.is_virtual_thunk
+            + self.is_dll_imported
+        )
+        assert num_xor_flags <= 1, "Multiple mutually exclusive flags are set!"
 
         assert self.name.kind == CxxTerm.Kind.QUALIFIED, "Symbol name terms must be Kind.QUALIFIED!"
 
@@ -685,6 +967,13 @@ class CxxSymbol:
         else:
             assert not self.vthunk_delta, "Non-virtual-thunks should not have `delta`!"
 
+    def clone(self) -> "CxxSymbol":
+        """
+        Return a copy of this symbol which can be modified independently of the original.
+        """
+        typ = self.type.clone() if self.type is not None else None
+        return replace(self, name=self.name.clone(), type=typ)
+
     def is_global_xtor(self) -> bool:
         """
         Determine if this is a global constructor/destructor symbol.
@@ -696,22 +985,24 @@ class CxxSymbol:
         Format this demangled symbol as a string with the goal of matching the output
         of upstream GNU's demangler.
         """
-        prefix_str = ""
+        parts: list[str] = []
         if self.is_global_xtor():
             xtor = "constructors" if self.is_global_constructor else "destructors"
-            prefix_str = f"global {xtor} keyed to "
+            parts.append(f"global {xtor} keyed to ")
         elif self.is_dll_imported:
-            prefix_str = "import stub for "
+            parts.append("import stub for ")
 
         if self.type is None:
+            # To match GNU, don't output `static` for static data symbols.
+            parts.append(str(self.name))
+
             # Format any suffix strings.
-            suffix_str = ""
             if self.is_vtable:
-                suffix_str = " virtual table"
-
-            # To match GNU, don't output `static` for static data symbols.
-            return f"{prefix_str}{self.name}{suffix_str}"
+                parts.append(" virtual table")
         else:
             # Format this as a declaration.
-            static_str = "static " if self.is_static else ""
-            return f"{prefix_str}{static_str}{self.type.format(identifier=self.name)}"
+            if self.is_static:
+                parts.append("static ")
+            parts.append(self.type.format(identifier=self.name))
+
+        return "".join(parts)
@@ -5,9 +5,9 @@ This implementation is effectively a Python port of the C implementation of
 the original GNU v2 demangler from upstream GCC 13.2.0, before its removal.
 """
 
-import copy
-from io import TextIOBase
-from typing import Optional, Union
+import functools
+import re
+from typing import Iterable, Optional, Union
 
 from gnu2_demangler.cxx import (
     CxxName,
@@ -18,22 +18,23 @@ from gnu2_demangler.cxx import (
     CxxValue,
 )
 from gnu2_demangler.io_util import (
-    as_stringio,
+    StrReader,
+    as_reader,
     bytes_left,
-    lookahead_for_substring,
-    lookahead_while,
     peek,
     peek_exact,
     peek_number,
-    peeking,
     read_exact,
     read_number,
     read_number_with_underscores,
 )
 from gnu2_demangler.token import Operator, Special, Token
 
+# A run of two or more underscores, which may separate a function name from its signature.
+_DUNDER_RE = re.compile(r"__+")
 
-def _read_odd_count(src: TextIOBase) -> int:
+
+def _read_odd_count(src: StrReader) -> int:
     """
     Read the given buffer expecting a count in a mangled name. If the buffer
     does not currently point to a count, raises an error.
@@ -79,7 +80,7 @@ class GNU2Demangler:
     def parse(self, symbol: str):
         self._reset()
 
-        with as_stringio(symbol) as buf:
+        with as_reader(symbol) as buf:
             return self._parse(buf)
 
     def _reset(self):
@@ -106,7 +107,7 @@ class GNU2Demangler:
         # Flags which can recursively increase/decrease.
         self._forgetting_types: int = 0
 
-    def _parse(self, src: TextIOBase) -> CxxSymbol:
+    def _parse(self, src: StrReader) -> CxxSymbol:
         """
         Parse the given buffer.
         """
@@ -191,7 +192,7 @@ class GNU2Demangler:
         self._btypes.clear()
         self._ktypes.clear()
 
-    def _gnu_special(self, src: TextIOBase) -> Optional[Union[CxxTerm, CxxSymbol]]:
+    def _gnu_special(self, src: StrReader) -> Optional[Union[CxxTerm, CxxSymbol]]:
         """
         Process special GNU style mangling forms that don't fit the normal pattern.
 
@@ -354,7 +355,7 @@ class GNU2Demangler:
 
         raise AssertionError("Unknown GNU special prefix.")
 
-    def _demangle_prefix(self, src: TextIOBase) -> Optional[Union[CxxTerm, CxxSymbol]]:
+    def _demangle_prefix(self, src: StrReader) -> Optional[Union[CxxTerm, CxxSymbol]]:
         """
         Consume and demangle the prefix of the mangled name. There are several possible
         return values:
@@ -393,13 +394,11 @@ class GNU2Demangler:
                         pass
 
         # Move forward to find a combination of two underscores (`__`).
-        dunder_offset: int = lookahead_for_substring(src, "__")
-        if dunder_offset is not None:
+        dunder = _DUNDER_RE.search(src.text, src.pos)
+        if dunder is not None:
             # We found a sequence of two or more `_` - ensure we start at the last
             # pair in the sequence.
-            seq_length = lookahead_while(src, ["_"], base_offset=dunder_offset)
-            if seq_length > 2:
-                dunder_offset += seq_length - 2
+            dunder_offset: int = dunder.end() - 2 - src.pos
 
             # Read the character after the found pair.
             after_dunder = Token.peek(src, offset=dunder_offset + 2)
@@ -427,18 +426,16 @@ class GNU2Demangler:
             ):
                 # The mangled name starts with `__`. Skip over any leading `_` characters,
                 #  then find the next `__` that separates the prefix from the signature.
-                rightmost_guess: Optional[int] = lookahead_for_substring(
-                    src, "__", dunder_offset + 2
-                )
+                # The run found above ends just before a non-`_` character, so the next
+                # match starts at the next `__`.
+                rightmost_guess = _DUNDER_RE.search(src.text, dunder.end())
                 if rightmost_guess is None:
                     raise ValueError(
                         "Expected a `__` substring further right in symbol prefix. "
                         "This symbol probably isn't GNUv2 mangled."
                     )
 
-                # Since we looked ahead from `dunder_offset + 2`, we need to add that to get the
-                # final guess offset from the current base.
-                result = self._iterate_demangle_function(src, dunder_offset + 2 + rightmost_guess)
+                result = self._iterate_demangle_function(src, rightmost_guess.start() - src.pos)
                 return result if isinstance(result, CxxSymbol) else CxxTerm.make_name([result])
 
             elif bytes_left(src, offset=dunder_offset + 2) > 0:
@@ -455,9 +452,7 @@ class GNU2Demangler:
 
         return None
 
-    def _demangle_signature(
-        self, src: TextIOBase, base_name: Optional[CxxName] = None
-    ) -> CxxSymbol:
+    def _demangle_signature(self, src: StrReader, base_name: Optional[CxxName] = None) -> CxxSymbol:
         """
         Given a buffer that points to the start of a mangled "signature", and optionally
         the base name of this symbol parsed from the symbol's prefix, demangle the signature
@@ -502,7 +497,7 @@ class GNU2Demangler:
                     # Class name.
                     name = self._demangle_class(src)
                     # Remember the mangled type we just parsed.
-                    self._remember_type(CxxType(terms=[copy.deepcopy(name)]))
+                    self._remember_type(CxxType(terms=[name.clone()]))
 
                     # Consume constructor/destructor flags if needed.
                     self._consume_xtor_if_needed(name)
@@ -576,7 +571,7 @@ class GNU2Demangler:
             if not func_args:
                 # Upstream demangler inserts "void" into all zero-length function param lists.
                 # To improve compatibility all-around, we'll do this too.
-                func_args = [CxxTerm(kind=CxxTerm.Kind.VOID)]
+                func_args = [CxxTerm.atomic(CxxTerm.Kind.VOID)]
 
             final_type = CxxType(
                 terms=[
@@ -584,10 +579,10 @@ class GNU2Demangler:
                         kind=CxxTerm.Kind.FUNCTION,
                         function_params=func_args,
                         function_return=func_ret,
-                    )
+                    ),
+                    *qualis,
                 ]
             )
-            final_type.terms.extend(qualis)
 
         else:
             # `demangle_signature` was called with an empty buffer, which means
@@ -607,7 +602,7 @@ class GNU2Demangler:
             is_dll_imported=self._dll_imported,
         )
 
-    def _demangle_args(self, src: TextIOBase) -> list[CxxType]:
+    def _demangle_args(self, src: StrReader) -> list[CxxType]:
         """
         Process the argument list of the signature after any class spec has been
         consumed, as well as the first "F" character if it exists. Examples:
@@ -629,7 +624,7 @@ class GNU2Demangler:
                     assert num_repeats > 0, f"Number of repeats `{num_repeats}` is invalid!"
                 # Add the backreferenced type (repeated if necessary) into the argument list.
                 repeated_type = self._demangle_backref_type(src)
-                args.extend([copy.deepcopy(repeated_type) for _ in range(num_repeats)])
+                args.extend([repeated_type.clone() for _ in range(num_repeats)])
 
             else:
                 args.append(self._do_arg(src))
@@ -642,7 +637,7 @@ class GNU2Demangler:
 
         return args
 
-    def _demangle_nested_args(self, src: TextIOBase) -> list[CxxType]:
+    def _demangle_nested_args(self, src: StrReader) -> list[CxxType]:
         """
         Demangle nested arguments. Similar to `demangle_args`, but used for nested
         function/method pointers instead of top-level declarations.
@@ -655,7 +650,7 @@ class GNU2Demangler:
         return args
 
     def _demangle_template(
-        self, src: TextIOBase, is_type: bool, remember: bool
+        self, src: StrReader, is_type: bool, remember: bool
     ) -> Union[CxxName, CxxTemplate]:
         """
         Demangle a template.
@@ -723,7 +718,7 @@ class GNU2Demangler:
             # Return just the template params.
             return templ.template
 
-    def _do_arg(self, src: TextIOBase) -> CxxType:
+    def _do_arg(self, src: StrReader) -> CxxType:
         """
         Demangle an argument type.
         """
@@ -737,93 +732,95 @@ class GNU2Demangler:
         self._remember_type(typ)
         return typ
 
-    def _do_type(self, src: TextIOBase) -> CxxType:
+    def _do_type(self, src: StrReader) -> CxxType:
         """
         Demangle a base type.
         """
-        done: bool = False
-        typ: CxxType = CxxType()
+        # Nested function return types are demangled by this same loop, one level per
+        # iteration, rather than by recursing into `_do_type()`.
+        result: CxxType = CxxType()
+        typ: CxxType = result
 
-        while not done:
-            next = Token.peek(src)
+        while True:
+            done: bool = False
 
-            if next.is_ptr_or_ref():
-                # Pointer or lvalue/rvalue reference
-                read_exact(src, 1)
-                typ.terms.append(next.get_ptr_ref_term())
+            while not done:
+                # Pointers, lvalue/rvalue references and CV qualifiers.
+                typ.terms.extend(Token.read_modifiers(src))
+                next = Token.peek(src)
 
-            elif next.is_array():
-                # Array
-                read_exact(src, 1)
+                if next.is_array():
+                    # Array
+                    read_exact(src, 1)
 
-                size = None
-                if not Token.peek(src).is_underscore():
-                    # Demangle a literal integer value.
-                    val = self._demangle_integral_value(src)
-                    assert isinstance(
-                        val.value, int
-                    ), "Only integer literal for array size are currently supported!"
-                    size = val.value
+                    size = None
+                    if not Token.peek(src).is_underscore():
+                        # Demangle a literal integer value.
+                        val = self._demangle_integral_value(src)
+                        assert isinstance(
+                            val.value, int
+                        ), "Only integer literal for array size are currently supported!"
+                        size = val.value
 
-                if Token.peek(src).is_underscore():
-                    # Consume any trailing underscore.
-                    read_exact(src, 1)
-                typ.terms.append(CxxTerm(kind=CxxTerm.Kind.ARRAY, array_dim=size))
+                    if Token.peek(src).is_underscore():
+                        # Consume any trailing underscore.
+                        read_exact(src, 1)
+                    typ.terms.append(CxxTerm(kind=CxxTerm.Kind.ARRAY, array_dim=size))
 
-            elif next.is_function():
-                # Function type.
-                read_exact(src, 1)
+                elif next.is_function():
+                    # Function type.
+                    read_exact(src, 1)
 
-                # Append the function term. Worry about the function return type later,
-                # we don't want to make a recursive call to `do_type` in this loop.
-                typ.terms.append(
-                    CxxTerm(
-                        kind=CxxTerm.Kind.FUNCTION, function_params=self._demangle_nested_args(src)
+                    # Append the function term. Worry about the function return type later,
+                    # we don't want to make a recursive call to `do_type` in this loop.
+                    typ.terms.append(
+                        CxxTerm(
+                            kind=CxxTerm.Kind.FUNCTION,
+                            function_params=self._demangle_nested_args(src),
+                        )
                     )
-                )
 
-                # We should either be pointing to a `_` which precedes the
-                # function's return type, or the end of the buffer.
-                next_char = peek(src)
-                next = Token.from_char(next_char)
-                assert (
-                    not next_char or next.is_underscore()
-                ), "Expected pre-return-type `_` or end of buffer after nested function args!"
+                    # We should either be pointing to a `_` which precedes the
+                    # function's return type, or the end of the buffer.
+                    next_char = peek(src)
+                    next = Token.from_char(next_char)
+                    assert (
+                        not next_char or next.is_underscore()
+                    ), "Expected pre-return-type `_` or end of buffer after nested function args!"
 
-                # Consume the underscore if it exists.
-                if next.is_underscore():
-                    read_exact(src, 1)
+                    # Consume the underscore if it exists.
+                    if next.is_underscore():
+                        read_exact(src, 1)
 
-                # The buffer should now point to the return type if it exists.
-                # Escape this loop.
-                done = True
+                    # The buffer should now point to the return type if it exists.
+                    # Escape this loop.
+                    done = True
 
-            elif next.kind == Token.Kind.UNK_M:
-                # Dunno what this is
-                assert False, "Dunno what 'M' is but it's not supported yet"
+                elif next.kind == Token.Kind.UNK_M:
+                    # Dunno what this is
+                    assert False, "Dunno what 'M' is but it's not supported yet"
 
-            elif next.kind == Token.Kind.UNK_G:
-                # Dunno what this is
-                read_exact(src, 1)
+                elif next.kind == Token.Kind.UNK_G:
+                    # Dunno what this is
+                    read_exact(src, 1)
 
-            elif next.is_cv_quali():
-                read_exact(src, 1)
-                typ.terms.append(next.get_quali_term())
-            else:
-                done = True
+                else:
+                    done = True
 
-        if typ.has_primitive_type():
-            # We exited the loop after demangling a set of nested function arguments.
-            prim_type = typ.primitive_type()
-            assert (
-                prim_type.kind.is_function()
-            ), f"Expected primitive type to be function, not {prim_type.kind}!"
+            if typ.has_primitive_type():
+                # We exited the loop after demangling a set of nested function arguments.
+                prim_type = typ.primitive_type()
+                assert (
+                    prim_type.kind.is_function()
+                ), f"Expected primitive type to be function, not {prim_type.kind}!"
+
+                # We're either pointing to a return type or to the end of the buffer.
+                if not peek(src):
+                    prim_type.function_return = CxxType(terms=[CxxTerm.atomic(CxxTerm.Kind.VOID)])
+                    break
 
-            # We're either pointing to a return type or to the end of the buffer.
-            return_type = CxxType(terms=[CxxTerm(kind=CxxTerm.Kind.VOID)])
-            if peek(src):
                 # The next sequence should be the function's return type.
-                # Recursively call `do_type()`.
+                # Demangle it in the next iteration.
                 #
                 # It's worth noting that, when demangling a nested function, upstream
                 # basically flushes the existing terms and continues iterating in the
@@ -834,50 +831,49 @@ class GNU2Demangler:
                 # This is only viable because upstream works solely with strings,
                 # and therefore doesn't differentiate between a function return type
                 # and any other plain type.
-                return_type = self._do_type(src)
+                typ = prim_type.function_return = CxxType()
+            else:
+                # The next character/sequence should give us an underlying type
+                next = Token.peek(src)
+                if next.is_qualified():
+                    typ.terms.append(self._demangle_qualified(src, is_funcname=False))
+                elif next.kind == Token.Kind.BACKREF_TYPE:
+                    read_exact(src, 1)
+                    typ.terms.extend(self._demangle_backref_type(src).terms)
+                elif next.kind == Token.Kind.BACKREF:
+                    assert False, "Back reference 'B' not supported yet"
+                elif next.is_template_backref_parm():
+                    # Function template parameter backref.
+                    assert self._func_templ, "Missing saved function template params for backref!"
 
-            prim_type.function_return = return_type
-        else:
-            # The next character/sequence should give us an underlying type
-            next = Token.peek(src)
-            if next.is_qualified():
-                typ.terms.append(self._demangle_qualified(src, is_funcname=False))
-            elif next.kind == Token.Kind.BACKREF_TYPE:
-                read_exact(src, 1)
-                typ.terms.extend(self._demangle_backref_type(src).terms)
-            elif next.kind == Token.Kind.BACKREF:
-                assert False, "Back reference 'B' not supported yet"
-            elif next.is_template_backref_parm():
-                # Function template parameter backref.
-                assert self._func_templ, "Missing saved function template params for backref!"
-
-                # Consume the 'X' or 'Y' type code.
-                read_exact(src, 1)
+                    # Consume the 'X' or 'Y' type code.
+                    read_exact(src, 1)
 
-                # Read the index into the template params.
-                arg_idx: int = read_number_with_underscores(src)
-                assert arg_idx >= 0 and arg_idx < len(
-                    self._func_templ.params
-                ), f"Index {arg_idx} for template param backref is out of bounds!"
-
-                # Read another number. This is unused in upstream, so probably just filler?
-                read_number_with_underscores(src)
-
-                param = self._func_templ.params[arg_idx]
-                # For some reason, backreffing literals for function args is supported in upstream,
-                # even though it would never make sense. We don't support it here, it would
-                # make things way too complicated.
-                assert isinstance(
-                    param, CxxType
-                ), "Non-type parameter backreferenced in template function params!"
-                # Append the template type's terms.
-                typ.terms.extend(param.terms)
-            else:
-                typ.terms.extend(self._demangle_fund_type(src).terms)
+                    # Read the index into the template params.
+                    arg_idx: int = read_number_with_underscores(src)
+                    assert arg_idx >= 0 and arg_idx < len(
+                        self._func_templ.params
+                    ), f"Index {arg_idx} for template param backref is out of bounds!"
 
-        return typ
+                    # Read another number. This is unused in upstream, so probably just filler?
+                    read_number_with_underscores(src)
+
+                    param = self._func_templ.params[arg_idx]
+                    # For some reason, backreffing literals for function args is supported in upstream,
+                    # even though it would never make sense. We don't support it here, it would
+                    # make things way too complicated.
+                    assert isinstance(
+                        param, CxxType
+                    ), "Non-type parameter backreferenced in template function params!"
+                    # Append the template type's terms.
+                    typ.terms.extend(param.terms)
+                else:
+                    typ.terms.extend(self._demangle_fund_type(src).terms)
+                break
+
+        return result
 
-    def _demangle_template_value_parm(self, src: TextIOBase, typ: CxxType) -> CxxValue:
+    def _demangle_template_value_parm(self, src: StrReader, typ: CxxType) -> CxxValue:
         """
         Demangle a "template value parameter" or a literal value (for example, an array index).
 
@@ -907,11 +903,11 @@ class GNU2Demangler:
             # No idea what this will be, just try to demangle an integral value.
             return self._demangle_integral_value(src)
 
-    def _demangle_template_template_parm(self, src: TextIOBase) -> CxxName:
+    def _demangle_template_template_parm(self, src: StrReader) -> CxxName:
         assert False, "Template template params not supported yet"
 
     def _iterate_demangle_function(
-        self, src: TextIOBase, guess_offset: int
+        self, src: StrReader, guess_offset: int
     ) -> Union[CxxName, CxxSymbol]:
         """
         Given:
@@ -931,6 +927,8 @@ class GNU2Demangler:
         # Manually save the current state of the buffer so we can restore it if
         # function name demangling fails.
         ptr = src.tell()
+        # Every later `__` separator guess, as the last pair in each run of underscores.
+        next_guesses = _DUNDER_RE.finditer(src.text, ptr + guess_offset + 2)
 
         # Iterate over occurrences of `__`, allowing names and types to have a
         # `__` sequence in them. We must start with the first occurrence (not the last),
@@ -960,22 +958,17 @@ class GNU2Demangler:
                     # we've found the function name other than to actually try and
                     # demangle a signature.
                     return self._demangle_signature(src, maybe_name)
-                except Exception as e:
+                except Exception:  # noqa
                     # Continue iterating, this wasn't a function signature.
-                    print(f"Signature was invalid for name: {maybe_name}")
-                    print(e)
                     pass
 
             # Reset the base pointer to cover the case where we succesfully demangled a
             # function name, but not a signature.
             src.seek(ptr)
 
-            # Consume the current `__` sequence and find the next `__` sequence.
-            guess_offset = lookahead_for_substring(src, "__", base_offset=guess_offset + 2)
-
-            # If we found another dunder, find the last pair of `_` in this sequence.
-            if guess_offset is not None:
-                guess_offset = lookahead_while(src, ["_"], base_offset=guess_offset) - 2
+            # Move on to the next `__` sequence.
+            next_dunder = next(next_guesses, None)
+            guess_offset = next_dunder.end() - 2 - ptr if next_dunder is not None else None
 
         if maybe_name is None:
             # We never found a function with a signature.
@@ -986,7 +979,7 @@ class GNU2Demangler:
 
         return maybe_name
 
-    def _demangle_function_name(self, src: TextIOBase, separator_offset: int) -> Optional[CxxName]:
+    def _demangle_function_name(self, src: StrReader, separator_offset: int) -> Optional[CxxName]:
         """
         Given:
         - a buffer pointing to the first character of what may be a function name
@@ -1001,7 +994,8 @@ class GNU2Demangler:
         name: CxxName = None
         consume: int = 0
 
-        with peeking(src):
+        ptr = src.tell()
+        try:
             # Read everything up to the separator as the prospective function name,
             # then consume the separator itself.
             func_name: str = read_exact(src, separator_offset)
@@ -1016,11 +1010,13 @@ class GNU2Demangler:
                 # This is a valid function name.
                 name = CxxName(func_name)
                 consume = separator_offset + 2
+        finally:
+            src.seek(ptr)
 
         read_exact(src, consume)
         return name
 
-    def _demangle_qualified(self, src: TextIOBase, is_funcname: bool) -> CxxTerm:
+    def _demangle_qualified(self, src: StrReader, is_funcname: bool) -> CxxTerm:
         """
         Demangle a qualified name, such as "Q25Outer5Inner" which is the mangled
         form of `Outer::Inner`.
@@ -1036,7 +1032,7 @@ class GNU2Demangler:
         if Token.read(src).kind == Token.Kind.QUALIFIED_NOREM:
             # A previous qualified name is being reused. Read the index and grab it.
             # We don't want to modify the original in the array, so copy it.
-            name_term.add_base_name(copy.deepcopy(self._demangle_ktype(src)))
+            name_term.add_base_name(self._demangle_ktype(src).clone())
 
         else:
             next = Token.peek(src)
@@ -1073,7 +1069,7 @@ class GNU2Demangler:
                 # Backreferenced qualified name.
                 read_exact(src, 1)
                 remember_k = False
-                name = copy.deepcopy(self._demangle_ktype(src))
+                name = self._demangle_ktype(src).clone()
 
             else:
                 # TODO: Upstream demangler calls `do_type` here. Instead we'll just
@@ -1095,7 +1091,7 @@ class GNU2Demangler:
 
         return name_term
 
-    def _demangle_fund_type(self, src: TextIOBase) -> CxxType:
+    def _demangle_fund_type(self, src: StrReader) -> CxxType:
         """
         Given a buffer that represents a type argument, try to decode the type.
         Examples include:
@@ -1131,7 +1127,7 @@ class GNU2Demangler:
 
         return CxxType(terms)
 
-    def _demangle_class(self, src: TextIOBase) -> CxxTerm:
+    def _demangle_class(self, src: StrReader) -> CxxTerm:
         """
         Demangle a class name and save it as a remembered k/btype.
         """
@@ -1142,7 +1138,7 @@ class GNU2Demangler:
         self._remember_btype(term)
         return term
 
-    def _demangle_quali_spec_terms(self, src: TextIOBase) -> list[CxxTerm]:
+    def _demangle_quali_spec_terms(self, src: StrReader) -> list[CxxTerm]:
         """
         Attempt to parse a list of ANSI C++ type qualifiers or arithmetic type specifiers
         from a buffer which points into a GNUv2 C++ mangled symbol.
@@ -1150,17 +1146,9 @@ class GNU2Demangler:
 
         If none are found, an empty list will be returned.
         """
-        qualis: list[CxxTerm] = []
-
-        next = Token.peek(src)
-        while next.is_cv_quali() or next.is_type_spec():
-            qualis.append(next.get_quali_spec_term())
-            read_exact(src, 1)
-            next = Token.peek(src)
+        return Token.read_quali_specs(src)
 
-        return qualis
-
-    def _demangle_class_name(self, src: TextIOBase) -> CxxName:
+    def _demangle_class_name(self, src: StrReader) -> CxxName:
         """
         Try to extract a class name from the buffer formatted as `[n][name]`, where:
         - `n` is the length of the name string, in bytes/chars
@@ -1169,12 +1157,12 @@ class GNU2Demangler:
         name_len = read_number(src)
         name: str = read_exact(src, name_len)
 
-        if Special.peek_for_global(src) == Special.Kind.GLOBAL_ANONYMOUS:
+        if Special.is_anonymous_name(name):
             name = "{anonymous}"
 
         return CxxName(name)
 
-    def _demangle_backref_type(self, src: TextIOBase) -> CxxType:
+    def _demangle_backref_type(self, src: StrReader) -> CxxType:
         """
         Demangle a backreferencing "T" type and return the referenced type. If the
         index is out of bounds, return an error.
@@ -1186,7 +1174,7 @@ class GNU2Demangler:
 
         return self._typevec[idx]
 
-    def _demangle_ktype(self, src: TextIOBase) -> CxxName:
+    def _demangle_ktype(self, src: StrReader) -> CxxName:
         """
         Given a buffer which contains a backreferencing K type index, get the corresponding
         backreferenced name. If the index is out of bounds, return an error.
@@ -1209,14 +1197,14 @@ class GNU2Demangler:
         elif operator.is_type_conv():
             start: int = 5 if operator.kind == Operator.Kind.TYPE_CONV else 4
             try:
-                with as_stringio(func_name[start:]) as src:
+                with as_reader(func_name[start:]) as src:
                     return f"operator {self._do_type(src)}"
             except:  # noqa
                 return None
         else:
             return None
 
-    def _demangle_integral_value(self, src: TextIOBase) -> CxxValue:
+    def _demangle_integral_value(self, src: StrReader) -> CxxValue:
         """
         Demangle an integral value.
         """
@@ -1274,7 +1262,7 @@ class GNU2Demangler:
                 value = -value
             return CxxValue(value=value)
 
-    def _demangle_real_value(self, src: TextIOBase) -> CxxValue:
+    def _demangle_real_value(self, src: StrReader) -> CxxValue:
         """
         Demangle a real (floating-point) value.
         """
@@ -1303,7 +1291,7 @@ class GNU2Demangler:
 
         return CxxValue(value=float(fp_str))
 
-    def _demangle_bool_value(self, src: TextIOBase) -> CxxValue:
+    def _demangle_bool_value(self, src: StrReader) -> CxxValue:
         """
         Demangle a `bool` literal value.
         """
@@ -1312,7 +1300,7 @@ class GNU2Demangler:
 
         return CxxValue(value=bool(value))
 
-    def _demangle_char_value(self, src: TextIOBase) -> CxxValue:
+    def _demangle_char_value(self, src: StrReader) -> CxxValue:
         """
         Demangle a `char` value.
         """
@@ -1331,7 +1319,7 @@ class GNU2Demangler:
 
         return CxxValue(value=result)
 
-    def _demangle_symbol_ref_value(self, src: TextIOBase) -> CxxValue:
+    def _demangle_symbol_ref_value(self, src: StrReader) -> CxxValue:
         """
         Demangle a literal symbol reference value.
         """
@@ -1379,23 +1367,76 @@ class GNU2Demangler:
             name_term.add_base_name(CxxName(f"{extra}{name_term.get_base_name().name}"))
 
 
-def parse(mangled: str) -> CxxSymbol:
+# Maximum number of symbols remembered by the `parse()` and `demangle()` caches.
+_CACHE_SIZE: int = 4096
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _parse_cached(mangled: str) -> CxxSymbol:
     """
-    Given a GNU v2 mangled C++ symbol string, attempt to parse the string into its
-    `CxxSymbol` equivalent. An exception will be raised if parsing fails.
+    Parse `mangled`, caching the result by symbol string. The returned symbol is shared
+    between callers and must not be modified.
     """
     p = GNU2Demangler()
     result = p.parse(mangled)
     return result
 
 
+def parse(mangled: str) -> CxxSymbol:
+    """
+    Given a GNU v2 mangled C++ symbol string, attempt to parse the string into its
+    `CxxSymbol` equivalent. An exception will be raised if parsing fails.
+
+    Results are cached by symbol string. Each call returns a fresh copy of the cached
+    symbol, so the caller is free to modify it. Use `parse.cache_clear()` to drop the
+    cache.
+    """
+    return _parse_cached(mangled).clone()
+
+
+parse.cache_info = _parse_cached.cache_info
+parse.cache_clear = _parse_cached.cache_clear
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
 def demangle(mangled: str) -> str:
     """
     Given a GNU v2 mangled C++ symbol string, attempt to parse the string into its
     `CxxSymbol` equivalent. If parsing fails, the given string will be returned
     unmodified.
+
+    Results are cached by symbol string. Use `demangle.cache_clear()` to drop the cache.
     """
     try:
-        return str(parse(mangled))
+        # Only the string is needed, so skip the copy `parse()` makes.
+        return str(_parse_cached(mangled))
     except Exception:  # noqa
         return mangled
+
+
+def demangle_many(
+    symbols: Iterable[str], workers: Optional[int] = 1, chunksize: int = 4096
+) -> list[str]:
+    """
+    Demangle each of the given GNU v2 mangled C++ symbol strings, in order. Symbols
+    which fail to parse are returned unmodified.
+
+    By default this is equivalent to calling `demangle()` on each symbol, and shares its
+    cache, so repeated symbols within a batch (or across batches) are only parsed once.
+
+    If `workers` is greater than 1 (or `None`, for one per CPU), the distinct symbols are
+    demangled in a pool of worker processes, `chunksize` symbols at a time. This only
+    pays off for large batches, since starting the pool is comparatively expensive.
+    """
+    if workers == 1:
+        return [demangle(mangled) for mangled in symbols]
+
+    # Imported here, since loading the process pool machinery noticeably slows down
+    # importing this module and most callers never need it.
+    from concurrent.futures import ProcessPoolExecutor
+
+    symbols = list(symbols)
+    unique = list(dict.fromkeys(symbols))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = dict(zip(unique, executor.map(demangle, unique, chunksize=chunksize)))
+    return [results[mangled] for mangled in symbols]
@@ -2,50 +2,74 @@
 Utility functions for working with text streams.
 """
 
+import re
 from contextlib import contextmanager
-from io import StringIO, TextIOBase
 from typing import Iterator, Optional
 
+# Mangled names are ASCII, so only ASCII digits count (unlike `str.isdecimal()`).
+_DIGITS = frozenset("0123456789")
+_DIGITS_RE = re.compile(r"[0-9]+")
 
-def read_exact(src: TextIOBase, size: int) -> str:
+
+class StrReader:
     """
-    Read exactly `n` bytes from `src`, or raise a ValueError
+    Read-only text stream over a string, which tracks its read position as an index.
+
+    This implements the subset of `TextIOBase` used by the demangler (`read()`, `tell()`
+    and `seek()`). The helpers in this module index `text` at `pos` directly instead of
+    going through those methods, since the demangler mostly reads a character at a time.
     """
-    value = src.read(size)
-    if len(value) != size:
-        raise ValueError(f"Unable to read {size} bytes; got {value!r}")
-    return value
 
+    __slots__ = ("text", "pos")
 
-@contextmanager
-def peeking(src: TextIOBase, offset: int = 0) -> Iterator[None]:
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def read(self, size: Optional[int] = -1) -> str:
+        start = self.pos
+        if size is None or size < 0:
+            value = self.text[start:]
+        else:
+            value = self.text[start : start + size]
+        self.pos = start + len(value)
+        return value
+
+    def tell(self) -> int:
+        return self.pos
+
+    def seek(self, pos: int, whence: int = 0) -> int:
+        if whence == 1:
+            pos += self.pos
+        elif whence == 2:
+            pos += len(self.text)
+        self.pos = pos
+        return pos
+
+
+def read_exact(src: StrReader, size: int) -> str:
     """
-    Store the current offset in `src`,
-    and restore it at the end of the context.
-    An optional offset can be added to start peeking further ahead from the current
-    location.
+    Read exactly `n` bytes from `src`, or raise a ValueError
     """
-    ptr = src.tell()
-    if offset:
-        src.seek(ptr + offset)
-
-    try:
-        yield
-    finally:
-        src.seek(ptr)
+    start = src.pos
+    value = src.text[start : start + size]
+    if len(value) != size:
+        raise ValueError(f"Unable to read {size} bytes; got {value!r}")
+    src.pos = start + size
+    return value
 
 
-def peek(src: TextIOBase, n: int = 1, offset: int = 0) -> Optional[str]:
+def peek(src: StrReader, n: int = 1, offset: int = 0) -> Optional[str]:
     """
     Read up to `n` bytes from `src` without advancing the offset.
     An optional offset can be added to peek starting further ahead of
     the current location.
     """
-    with peeking(src, offset=offset):
-        return src.read(n)
+    start = src.pos + offset
+    return src.text[start : start + n]
 
 
-def peek_exact(src: TextIOBase, n: int = 1, offset: int = 0) -> Optional[str]:
+def peek_exact(src: StrReader, n: int = 1, offset: int = 0) -> Optional[str]:
     """
     Try to read exactly `n` bytes from `src` without advancing the offset.
     If there are not enough bytes in the buffer, return "".
@@ -56,91 +80,25 @@ def peek_exact(src: TextIOBase, n: int = 1, offset: int = 0) -> Optional[str]:
     return string
 
 
-def bytes_left(src: TextIOBase, offset: int = 0) -> int:
+def bytes_left(src: StrReader, offset: int = 0) -> int:
     """
     Retrieve the number of bytes left in `src`.
     An optional offset can be added.
     """
-    start: int = src.tell() + offset
-    with peeking(src):
-        src.seek(0, 2)
-        end: int = src.tell()
-
-    return end - start
-
-
-def lookahead_for(src: TextIOBase, chars: list[str]) -> Optional[int]:
-    """
-    Look ahead in the buffer for a character in the given list.
-
-    If one is found, return the number of chars that need to be read from the current
-    offset in order to reach the character.
-
-    If none of the given chars are found and the end of the buffer is found,
-    returns None.
-    """
-    offset: int = 0
-    with peeking(src):
-        char = src.read(1)
-        while char:
-            if char in chars:
-                return offset
-            offset += 1
-            char = src.read(1)
-
-    return None
-
-
-def lookahead_for_substring(src: TextIOBase, string: str, base_offset: int = 0) -> Optional[int]:
-    """
-    Look ahead in the buffer for a given substring. An optional "base_offset" can be
-    provided to start from a later point in the buffer.
-
-    If one is found, return the number of chars that need to be read in order
-    to reach the start of the substring (starting from [current location + base offset]).
-
-    If the substring is not found in the buffer, returns None.
-    """
-
-    offset: int = 0
-
-    substr = peek(src, n=len(string), offset=base_offset)
-    while substr:
-        if substr == string:
-            return offset
-        offset += 1
-        substr = peek(src, n=len(string), offset=base_offset + offset)
-
-    return None
-
-
-def lookahead_while(src: TextIOBase, chars: list[str], base_offset: int = 0) -> int:
-    """
-    Look ahead in the buffer as long as the buffer contains characters in the given list.
-    Return the number of subsequent characters found.
-    An optional offset can be passed to start from a later point in the buffer.
-    """
-    num_chars: int = 0
-    with peeking(src, offset=base_offset):
-        char = src.read(1)
-        while char in chars:
-            num_chars += 1
-            char = src.read(1)
-
-    return num_chars
+    return len(src.text) - src.pos - offset
 
 
 @contextmanager
-def as_stringio(src: str) -> Iterator[StringIO]:
-    """Wrap `src` in a `StringIO`, and assert it was fully consumed at the end of the context"""
-    buf = StringIO(src)
+def as_reader(src: str) -> Iterator[StrReader]:
+    """Wrap `src` in a `StrReader`, and assert it was fully consumed at the end of the context"""
+    buf = StrReader(src)
     yield buf
     leftover = buf.read()
     if leftover:
         raise ValueError(f"Unable to parse full input, leftover chars: {leftover!r}")
 
 
-def peek_number(src: TextIOBase) -> Optional[tuple[int, int]]:
+def peek_number(src: StrReader) -> Optional[tuple[int, int]]:
     """
     Peek subsequent numeric characters from the source and return them as a positive
     base-10 integer.
@@ -152,21 +110,14 @@ def peek_number(src: TextIOBase) -> Optional[tuple[int, int]]:
     If a number cannot be read, `None` will be returned.
     """
 
-    # Read each digit.
-    offset = 0
-    number_str = ""
-
-    with peeking(src):
-        while peek(src).isdecimal():
-            number_str += read_exact(src, 1)
-            offset += 1
-
-    if number_str == "":
+    match = _DIGITS_RE.match(src.text, src.pos)
+    if match is None:
         return None
-    return (int(number_str), offset)
+    number_str = match.group()
+    return (int(number_str), len(number_str))
 
 
-def read_number(src: TextIOBase, allow_zero: bool = False) -> int:
+def read_number(src: StrReader, allow_zero: bool = False) -> int:
     """
     Read subsequent numeric characters from the source and return them as a positive
     base-10 integer.
@@ -190,7 +141,7 @@ def read_number(src: TextIOBase, allow_zero: bool = False) -> int:
     return number
 
 
-def read_number_with_underscores(src: TextIOBase) -> int:
+def read_number_with_underscores(src: StrReader) -> int:
     """
     Given a buffer which matches one of the following cases, read the number as a
     base-10 decimal and return it.
@@ -213,7 +164,7 @@ def read_number_with_underscores(src: TextIOBase) -> int:
         # Consume the underscore suffix.
         read_exact(src, 1)
     else:
-        if not peek(src).isdecimal():
+        if peek(src) not in _DIGITS:
             raise ValueError(f"Expected to read single decimal digit, got `{peek(src)}`!")
         number = int(read_exact(src, 1))
 
@@ -4,12 +4,13 @@ Module implementing variant types for GNU demangler type codes and prefixes.
 These variants are mostly used to improve the readability of the parser.
 """
 
+import functools
+import re
 from dataclasses import dataclass
-from io import TextIOBase
 from typing import ClassVar, Optional
 
 from gnu2_demangler.cxx import CxxTerm
-from gnu2_demangler.io_util import peek, peek_exact, read_exact
+from gnu2_demangler.io_util import StrReader, peek, peek_exact, read_exact
 from gnu2_demangler.strenum import StrEnum
 
 
@@ -105,6 +106,37 @@ class Token:
         Kind.LVALUE_REFERENCE: CxxTerm.Kind.LVALUE_REFERENCE,
         Kind.RVALUE_REFERENCE: CxxTerm.Kind.RVALUE_REFERENCE,
     }
+    # Pointer, reference and CV qualifier codes, keyed by character.
+    _MODIFIER_TERMS: ClassVar[dict[str, CxxTerm]] = {
+        "P": CxxTerm.atomic(CxxTerm.Kind.POINTER),
+        "p": CxxTerm.atomic(CxxTerm.Kind.POINTER),
+        "R": CxxTerm.atomic(CxxTerm.Kind.LVALUE_REFERENCE),
+        "O": CxxTerm.atomic(CxxTerm.Kind.RVALUE_REFERENCE),
+        "C": CxxTerm.atomic(CxxTerm.Kind.CONST),
+        "V": CxxTerm.atomic(CxxTerm.Kind.VOLATILE),
+        "u": CxxTerm.atomic(CxxTerm.Kind.RESTRICT),
+    }
+    # CV qualifier and arithmetic type specifier codes, keyed by character.
+    _QUALI_SPEC_TERMS: ClassVar[dict[str, CxxTerm]] = {
+        "C": CxxTerm.atomic(CxxTerm.Kind.CONST),
+        "V": CxxTerm.atomic(CxxTerm.Kind.VOLATILE),
+        "u": CxxTerm.atomic(CxxTerm.Kind.RESTRICT),
+        "U": CxxTerm.atomic(CxxTerm.Kind.UNSIGNED),
+        "S": CxxTerm.atomic(CxxTerm.Kind.SIGNED),
+        "J": CxxTerm.atomic(CxxTerm.Kind.COMPLEX),
+    }
+    _MARKER_CHARS: ClassVar[frozenset[str]] = frozenset("$.\0")
+    _DIGIT_CHARS: ClassVar[frozenset[str]] = frozenset("0123456789")
+    # Tokens are immutable, so the token for each character is built once and shared.
+    _TOKENS_BY_CHAR: ClassVar[dict[str, "Token"]] = {}
+    _REF_KINDS: ClassVar[frozenset[Kind]] = frozenset(
+        {Kind.LVALUE_REFERENCE, Kind.RVALUE_REFERENCE}
+    )
+    _QUALIFIED_KINDS: ClassVar[frozenset[Kind]] = frozenset({Kind.QUALIFIED, Kind.QUALIFIED_NOREM})
+    _TEMPLATE_START_KINDS: ClassVar[frozenset[Kind]] = frozenset({Kind.TEMPLATE, Kind.TEMPLATE_GPP})
+    _TEMPLATE_BACKREF_KINDS: ClassVar[frozenset[Kind]] = frozenset(
+        {Kind.TEMPLATE_ARG_BACKREF1, Kind.TEMPLATE_ARG_BACKREF2}
+    )
 
     kind: Kind
     content: str
@@ -143,7 +175,7 @@ class Token:
         """
         Determine if this is a reference.
         """
-        return self.kind in [Token.Kind.LVALUE_REFERENCE, Token.Kind.RVALUE_REFERENCE]
+        return self.kind in self._REF_KINDS
 
     def is_ptr_or_ref(self) -> bool:
         """
@@ -173,22 +205,19 @@ class Token:
         """
         Determine if this is a qualified type.
         """
-        return self.kind in [Token.Kind.QUALIFIED, Token.Kind.QUALIFIED_NOREM]
+        return self.kind in self._QUALIFIED_KINDS
 
     def is_template_start(self) -> bool:
         """
         Determine if this code signifies the start of a template.
         """
-        return self.kind in [Token.Kind.TEMPLATE, Token.Kind.TEMPLATE_GPP]
+        return self.kind in self._TEMPLATE_START_KINDS
 
     def is_template_backref_parm(self) -> bool:
         """
         Determine if this code is some kind of template backref parameter.
         """
-        return self.kind in [
-            Token.Kind.TEMPLATE_ARG_BACKREF1,
-            Token.Kind.TEMPLATE_ARG_BACKREF2,
-        ]
+        return self.kind in self._TEMPLATE_BACKREF_KINDS
 
     def is_underscore(self) -> bool:
         """
@@ -201,14 +230,14 @@ class Token:
         If this is a CV qualifier type, return an equivalent CV qualifier `CxxTerm`.
         Otherwise, throw an error.
         """
-        return CxxTerm(kind=self._QUALI_MAP[self.kind])
+        return CxxTerm.atomic(self._QUALI_MAP[self.kind])
 
     def get_spec_term(self) -> CxxTerm:
         """
         If this is a type specifier, return an equivalent type specifier `CxxTerm`.
         Otherwise, throw an error.
         """
-        return CxxTerm(kind=self._SPEC_MAP[self.kind])
+        return CxxTerm.atomic(self._SPEC_MAP[self.kind])
 
     def get_quali_spec_term(self) -> CxxTerm:
         """
@@ -226,14 +255,14 @@ class Token:
         If this is a primitive type, return an equivalent `CxxTerm`.
         Otherwise, throw an error.
         """
-        return CxxTerm(kind=self._PRIM_MAP[self.kind])
+        return CxxTerm.atomic(self._PRIM_MAP[self.kind])
 
     def get_ptr_ref_term(self) -> CxxTerm:
         """
         If this is a pointer or reference type, return an equivalent `CxxTerm`.
         Otherwise, throw an error.
         """
-        return CxxTerm(kind=self._PTR_REF_MAP[self.kind])
+        return CxxTerm.atomic(self._PTR_REF_MAP[self.kind])
 
     def __bool__(self) -> bool:
         return self.kind != Token.Kind.UNKNOWN
@@ -243,22 +272,30 @@ class Token:
         """
         Construct this variant with the given character and determine its type code.
         """
+        token = Token._TOKENS_BY_CHAR.get(char)
+        if token is not None:
+            return token
+
         try:
             kind = Token.Kind(char)
         except:  # noqa
             if char == "P":
                 kind = Token.Kind.POINTER  # Pointer can be upper or lowercase
-            elif char in set("$.\0"):
+            elif char in Token._MARKER_CHARS:
                 kind = Token.Kind.MARKER
-            elif char.isdecimal():
+            elif char in Token._DIGIT_CHARS:
                 kind = Token.Kind.DIGIT
             else:
                 kind = Token.Kind.UNKNOWN
 
-        return Token(kind=kind, content=char)
+        token = Token(kind=kind, content=char)
+        # Mangled names are ASCII, so only cache those tokens to keep the cache bounded.
+        if char.isascii():
+            Token._TOKENS_BY_CHAR[char] = token
+        return token
 
     @staticmethod
-    def peek(src: TextIOBase, offset: int = 0) -> "Token":
+    def peek(src: StrReader, offset: int = 0) -> "Token":
         """
         Construct this variant by peeking the next character in the given buffer.
         The buffer is not modified.
@@ -266,7 +303,7 @@ class Token:
         return Token.from_char(peek(src, 1, offset=offset))
 
     @staticmethod
-    def read(src: TextIOBase) -> "Token":
+    def read(src: StrReader) -> "Token":
         """
         Construct this variant by reading the next character in the given buffer.
         An error will be thrown if there are no characters remaining in the buffer.
@@ -274,7 +311,44 @@ class Token:
         return Token.from_char(read_exact(src, 1))
 
     @staticmethod
-    def scan_for_marker(src: TextIOBase) -> Optional[int]:
+    def read_modifiers(src: StrReader) -> list[CxxTerm]:
+        """
+        Read a run of pointer, reference and CV qualifier codes from the given buffer,
+        and return their equivalent `CxxTerm`s in order.
+        The buffer is left pointing to the first character after the run.
+        """
+        return Token._read_term_run(src, Token._MODIFIER_TERMS)
+
+    @staticmethod
+    def read_quali_specs(src: StrReader) -> list[CxxTerm]:
+        """
+        Read a run of CV qualifier and arithmetic type specifier codes from the given
+        buffer, and return their equivalent `CxxTerm`s in order.
+        The buffer is left pointing to the first character after the run.
+        """
+        return Token._read_term_run(src, Token._QUALI_SPEC_TERMS)
+
+    @staticmethod
+    def _read_term_run(src: StrReader, terms_by_char: dict[str, CxxTerm]) -> list[CxxTerm]:
+        """
+        Read characters from the given buffer for as long as they are keys of
+        `terms_by_char`, and return the corresponding terms in order.
+        """
+        text = src.text
+        pos = src.pos
+        terms: list[CxxTerm] = []
+
+        term = terms_by_char.get(text[pos : pos + 1])
+        while term is not None:
+            terms.append(term)
+            pos += 1
+            term = terms_by_char.get(text[pos : pos + 1])
+
+        src.pos = pos
+        return terms
+
+    @staticmethod
+    def scan_for_marker(src: StrReader) -> Optional[int]:
         """
         Look ahead in the buffer and scan for the next token of type `MARKER`.
         If a marker is found, return its offset from the current buffer location.
@@ -298,7 +372,7 @@ class Token:
         return self.content
 
 
-@dataclass
+@dataclass(frozen=True)
 class Operator:
     """
     Variant type for GNUv2 operator overload prefixes.
@@ -420,6 +494,10 @@ class Operator:
         Kind.SHIFT_LEFT: Kind.SHIFT_LEFT_ASSIGN,
         Kind.SHIFT_RIGHT: Kind.SHIFT_RIGHT_ASSIGN,
     }
+    _TYPE_CONV_KINDS: ClassVar[frozenset[Kind]] = frozenset({Kind.TYPE_CONV, Kind.ANSI_TYPE_CONV})
+    # Lookup from operator code to kind. Most function names are not operators, so a
+    # dict miss is much cheaper than a failed `Kind(...)` call.
+    _KINDS_BY_CODE: ClassVar[dict[str, Kind]] = {kind.value: kind for kind in Kind}
 
     kind: Kind
 
@@ -427,7 +505,7 @@ class Operator:
         return self.kind == Operator.Kind.UNKNOWN
 
     def is_type_conv(self) -> bool:
-        return self.kind in [Operator.Kind.TYPE_CONV, Operator.Kind.ANSI_TYPE_CONV]
+        return self.kind in self._TYPE_CONV_KINDS
 
     def has_known_name(self) -> bool:
         """
@@ -447,10 +525,13 @@ class Operator:
         return self.get_name()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def from_func_name(func_name: str) -> "Operator":
         """
         Given a function name, attempt to determine if it is an operator overload
         of some kind.
+
+        Results are cached by function name, since the same names recur across symbols.
         """
 
         is_marked_op: bool = (
@@ -472,13 +553,10 @@ class Operator:
             remaining: str = func_name[10:] if is_assignment else func_name[3:]
 
             # See if the rest of the string is an operator shorthand.
-            try:
-                kind = Operator.Kind(remaining)
-                if is_assignment:
-                    # Convert to assignment operator.
-                    kind = Operator._OP_ASSIGNS[kind]
-            except:  # noqa
-                kind = Operator.Kind.UNKNOWN
+            kind = Operator._KINDS_BY_CODE.get(remaining, Operator.Kind.UNKNOWN)
+            if is_assignment:
+                # Convert to assignment operator.
+                kind = Operator._OP_ASSIGNS.get(kind, Operator.Kind.UNKNOWN)
 
         elif is_type_conv:
             kind = Operator.Kind.TYPE_CONV
@@ -488,10 +566,7 @@ class Operator:
         elif is_unmarked_op:
             # Some other operator format.
             maybe_op: str = func_name[2:]
-            try:
-                kind = Operator.Kind(maybe_op)
-            except:  # noqa
-                pass
+            kind = Operator._KINDS_BY_CODE.get(maybe_op, Operator.Kind.UNKNOWN)
 
         return Operator(kind=kind)
 
@@ -515,34 +590,41 @@ class Special:
         TINFO_NODE = "typeinfo_node"
         TINFO_FUNC = "typeinfo_func"
 
-    _DATA_CHARS: ClassVar[set[str]] = set("0123456789Qt")
+    _DATA_CHARS: ClassVar[frozenset[str]] = frozenset("0123456789Qt")
+    _DLL_IMPORT_PREFIXES: ClassVar[frozenset[str]] = frozenset({"_imp__", "__imp_"})
     _GLOBAL_MAP: ClassVar[dict[str, Kind]] = {
         "I": Kind.GLOBAL_CTOR,
         "D": Kind.GLOBAL_DTOR,
         "N": Kind.GLOBAL_ANONYMOUS,
     }
+    # `_GLOBAL_` followed by a global kind code between two copies of the same marker,
+    # such as `_GLOBAL_$I$`.
+    _GLOBAL_RE: ClassVar[re.Pattern] = re.compile(r"_GLOBAL_([$.\0])([IDN])\1")
+    _TYPE_INFO_KINDS: ClassVar[frozenset[Kind]] = frozenset({Kind.TINFO_NODE, Kind.TINFO_FUNC})
+    _GLOBAL_KINDS: ClassVar[frozenset[Kind]] = frozenset(
+        {Kind.GLOBAL_CTOR, Kind.GLOBAL_DTOR, Kind.GLOBAL_ANONYMOUS}
+    )
 
     kind: Kind
     content: str
 
     def is_type_info(self) -> bool:
-        return self.kind in [Special.Kind.TINFO_NODE, Special.Kind.TINFO_FUNC]
+        return self.kind in self._TYPE_INFO_KINDS
 
     def is_global(self) -> bool:
-        return self.kind in [
-            Special.Kind.GLOBAL_CTOR,
-            Special.Kind.GLOBAL_DTOR,
-            Special.Kind.GLOBAL_ANONYMOUS,
-        ]
+        return self.kind in self._GLOBAL_KINDS
 
     @staticmethod
-    def peek(src: TextIOBase) -> "Special":
+    def peek(src: StrReader) -> "Special":
         """
         Try to peek into the given buffer to read a GNUv2 special prefix.
 
         If no special prefix can be parsed, the returned `Special` object will have
         `Kind == UNKNOWN`, and `content` will be empty.
         """
+        # Every special prefix starts with an underscore, which most symbols don't.
+        if peek(src) != "_":
+            return Special(kind=Special.Kind.UNKNOWN, content="")
 
         content: str = peek_exact(src, 2)
         if content:
@@ -598,7 +680,7 @@ class Special:
         return Special(kind=Special.Kind.UNKNOWN, content="")
 
     @staticmethod
-    def peek_for_dllimport(src: TextIOBase) -> Optional["Special"]:
+    def peek_for_dllimport(src: StrReader) -> Optional["Special"]:
         """
         Try to peek into the given buffer, looking specifically for a DLL import
         prefix.
@@ -606,13 +688,13 @@ class Special:
         If a DLL import token is found, returns the token. Otherwise, returns `None`.
         """
         content = peek_exact(src, 6)
-        if content in ["_imp__", "__imp_"]:
+        if content in Special._DLL_IMPORT_PREFIXES:
             return Special(kind=Special.Kind.DLL_IMPORT, content=content)
 
         return None
 
     @staticmethod
-    def peek_for_global(src: TextIOBase) -> Optional["Special"]:
+    def peek_for_global(src: StrReader) -> Optional["Special"]:
         """
         Try to peek into the given buffer, looking specifically for a `_GLOBAL_`-prefixed
         special token (CTOR, DTOR, ANONYMOUS).
@@ -621,16 +703,18 @@ class Special:
         Otherwise, returns a `Special` token whose `kind` is guaranteed to be global
         and whose `content` contains the characters peeked for the token.
         """
-        content = peek_exact(src, 11)
-        if content.startswith("_GLOBAL_"):
-            marked_chunk = content[8:]
-            if (
-                Token.from_char(marked_chunk[0]).is_marker()
-                and Token.from_char(marked_chunk[2]).is_marker()
-            ):
-                kind = Special._GLOBAL_MAP.get(marked_chunk[1])
-                if kind:
-                    # Global ctor/dtor/anonymous field.
-                    return Special(kind=kind, content=content)
+        match = Special._GLOBAL_RE.match(src.text, src.pos)
+        if match is None:
+            return None
 
-        return None
+        # Global ctor/dtor/anonymous field.
+        return Special(kind=Special._GLOBAL_MAP[match.group(2)], content=match.group())
+
+    @staticmethod
+    def is_anonymous_name(name: str) -> bool:
+        """
+        Determine if the given class or namespace name is the compiler-generated name of
+        an anonymous namespace (`_GLOBAL_$N$...`).
+        """
+        match = Special._GLOBAL_RE.match(name)
+        return match is not None and match.group(2) == "N"
@@ -2,9 +2,20 @@
 Tests for demangler.
 """
 
+import concurrent.futures
 from dataclasses import dataclass
 
-from gnu2_demangler import parse
+from gnu2_demangler import (
+    CxxDeclComponent,
+    CxxName,
+    CxxTemplate,
+    CxxTerm,
+    CxxType,
+    CxxValue,
+    demangle,
+    demangle_many,
+    parse,
+)
 
 
 @dataclass
@@ -643,6 +654,38 @@ def test_global_xtors():
         test.test()
 
 
+def test_anonymous_namespace():
+    """
+    Verify that anonymous namespace names are demangled correctly.
+    """
+    test_data = [
+        CaseData(
+            input="foo__14_GLOBAL_$N$bar",
+            expected="{anonymous}::foo(void)",
+            expected_no_params="{anonymous}::foo",
+        ),
+        CaseData(
+            input="foo__Q214_GLOBAL_$N$bar3Baz",
+            expected="{anonymous}::Baz::foo(void)",
+            expected_no_params="{anonymous}::Baz::foo",
+        ),
+        CaseData(
+            input="foo__14_GLOBAL_.N.bar",
+            expected="{anonymous}::foo(void)",
+            expected_no_params="{anonymous}::foo",
+        ),
+        # The markers on either side of the `N` must be the same.
+        CaseData(
+            input="foo__14_GLOBAL_$N.bar",
+            expected="_GLOBAL_$N.bar::foo(void)",
+            expected_no_params="_GLOBAL_$N.bar::foo",
+        ),
+    ]
+
+    for test in test_data:
+        test.test()
+
+
 def test_static_data():
     """
     Verify that static data fields are demangled correctly.
@@ -772,3 +815,157 @@ def test_template_functions():
 
     for test in test_data:
         test.test()
+
+
+def test_multiple_separators():
+    """
+    Verify that function names containing `__` are split at the right separator.
+    """
+    test_data = [
+        CaseData(input="a__b__c__i", expected="a__b__c(int)", expected_no_params="a__b__c"),
+        CaseData(input="a__b__c__Fi", expected="a__b__c(int)", expected_no_params="a__b__c"),
+        CaseData(
+            input="c__cl__6Normal",
+            expected="Normal::c__cl(void)",
+            expected_no_params="Normal::c__cl",
+        ),
+        CaseData(
+            input="get__x__C3Fooi",
+            expected="Foo::get__x(int) const",
+            expected_no_params="Foo::get__x",
+        ),
+    ]
+
+    for test in test_data:
+        test.test()
+
+
+def test_repeated_str():
+    """
+    Verify that printing a symbol or declarator does not modify it.
+    """
+    for symbol in ["f__FPCPc", "f__FRCPCc", "f__FPCPFi_v"]:
+        parsed = parse(symbol)
+        assert str(parsed) == str(parsed)
+
+    decl = CxxDeclComponent(
+        kind=CxxDeclComponent.Kind.POINTER,
+        terms=[CxxTerm.atomic(CxxTerm.Kind.CONST), CxxTerm.atomic(CxxTerm.Kind.POINTER)],
+    )
+    assert str(decl) == "* const"
+    assert str(decl) == "* const"
+    assert [term.kind for term in decl.terms] == [CxxTerm.Kind.CONST, CxxTerm.Kind.POINTER]
+
+
+def test_cache():
+    """
+    Test that repeated demangling of the same symbol is served from the cache.
+    """
+    parse.cache_clear()
+    demangle.cache_clear()
+
+    first = parse("textShake__FiPi")
+    second = parse("textShake__FiPi")
+    assert parse.cache_info().hits == 1
+
+    # Cached symbols are copied, so modifying one result doesn't affect later ones.
+    assert second is not first
+    first.name.get_base_name().name = "shake"
+    first.type.primitive_type().function_params.pop()
+    assert str(first) == "shake(int)"
+    assert str(second) == "textShake(int, int *)"
+    assert str(parse("textShake__FiPi")) == "textShake(int, int *)"
+
+    assert demangle("textShake__FiPi") == "textShake(int, int *)"
+    assert demangle("textShake__FiPi") == "textShake(int, int *)"
+    assert demangle.cache_info().hits == 1
+
+    # Failed demangling is cached as the unmodified input.
+    assert demangle("aa__aa") == "aa__aa"
+
+
+def test_demangle_many(monkeypatch):
+    """
+    Test demangling a batch of symbols, including repeats and failures.
+    """
+    symbols = ["textShake__FiPi", "aa__aa", "textShake__FiPi"]
+    expected = ["textShake(int, int *)", "aa__aa", "textShake(int, int *)"]
+    assert demangle_many(symbols) == expected
+    assert demangle_many(iter([])) == []
+
+    # Run the worker path in-process, recording which symbols are sent to the pool.
+    mapped = []
+
+    class FakeExecutor:
+        def __init__(self, max_workers=None):
+            self.max_workers = max_workers
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def map(self, fn, items, chunksize=1):
+            mapped.extend(items)
+            return map(fn, items)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", FakeExecutor)
+    assert demangle_many(iter(symbols), workers=2) == expected
+    # Each distinct symbol is only demangled once, and results keep the input order.
+    assert mapped == ["textShake__FiPi", "aa__aa"]
+
+
+def test_term_kind_strings():
+    """
+    Verify that term kinds keep their string values.
+    """
+    assert CxxTerm.Kind("int") is CxxTerm.Kind.INT
+    assert CxxTerm.Kind.LONG_LONG == "long long"
+    assert str(CxxTerm.Kind.POINTER) == "*"
+    assert parse("textShake__FiPi").type.terms[0].kind == "function"
+
+
+def test_type_terms_mutation():
+    """
+    Verify that a type's primitive type follows changes to its terms.
+    """
+    typ = parse("textShake__FiPi").type.terms[0].function_params[1]
+    assert typ.primitive_type().kind == CxxTerm.Kind.INT
+
+    typ.terms[-1] = CxxTerm(kind=CxxTerm.Kind.CHAR)
+    assert typ.primitive_type().kind == CxxTerm.Kind.CHAR
+    assert str(typ) == "char *"
+
+    typ.terms[-1] = CxxTerm(kind=CxxTerm.Kind.CONST)
+    assert not typ.has_primitive_type()
+
+
+def test_name_mutation():
+    """
+    Verify that printing a name follows every way of changing it or its template.
+    """
+    name = CxxName("vector")
+    assert str(name) == "vector"
+
+    name.add_template_param(CxxType(terms=[CxxTerm(kind=CxxTerm.Kind.INT)]))
+    assert str(name) == "vector<int>"
+
+    # Appending to the params directly.
+    name.template.params.append(CxxValue(value=3))
+    assert str(name) == "vector<int, 3>"
+
+    # Mutating a nested parameter.
+    name.template.params[0].terms.insert(0, CxxTerm(kind=CxxTerm.Kind.UNSIGNED))
+    assert str(name) == "vector<unsigned int, 3>"
+
+    # Replacing the template outright.
+    name.template = CxxTemplate(params=[CxxName("Alloc")])
+    assert str(name) == "vector<Alloc>"
+    name.template = None
+    assert str(name) == "vector"
+
+    # Qualifying a parsed name in place.
+    term = parse("foo__3Bar").name
+    term.qualify_with(CxxTerm.make_name([CxxName("ns")]))
+    assert str(term) == "ns::Bar::foo"